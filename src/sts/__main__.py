@@ -12,7 +12,7 @@ def _start_app():
     app_settings = container.get(AppSettings)
 
     l.info("Starting web host")
-    uvicorn.run("sts.host:app", **app_settings.uvicorn)
+    uvicorn.run("sts.host:create_app", factory=True, **app_settings.uvicorn)
 
 
 if __name__ == "__main__":
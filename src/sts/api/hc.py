@@ -9,10 +9,13 @@ from sts.models.bucket import BucketsInfo
 
 hc_router = APIRouter(route_class=DishkaSyncRoute)
 
-@hc_router.get('/hc')
-@hc_router.get('/health')
-def get_hc(response: fastapi.Response, service: FromDishka[HealthCheckReader]) -> BucketsInfo:
-    result = service.bucket_info
-    if result.error:
-        response.status_code = starlette.status.HTTP_500_INTERNAL_SERVER_ERROR
-    return result
+
+@hc_router.get('/hc', response_model=BucketsInfo)
+@hc_router.get('/health', response_model=BucketsInfo)
+def get_hc(service: FromDishka[HealthCheckReader]) -> fastapi.Response:
+    # bucket info never changes after startup, so the pre-serialized body is returned as is
+    status_code = starlette.status.HTTP_500_INTERNAL_SERVER_ERROR if service.bucket_info.error \
+        else starlette.status.HTTP_200_OK
+    return fastapi.Response(content=service.bucket_info_json,
+                            media_type="application/json",
+                            status_code=status_code)
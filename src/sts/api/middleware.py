@@ -0,0 +1,24 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from sts.logs import set_request_context, reset_request_context
+
+
+class RequestContextMiddleware:
+    """
+    Pure ASGI middleware which binds the request path to log records written while the request is handled.
+    Context variables are copied into the threadpool, so sync endpoints see the same context.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self._app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        token = set_request_context(path=scope["path"])
+        try:
+            await self._app(scope, receive, send)
+        finally:
+            reset_request_context(token)
@@ -1,5 +1,3 @@
-from itertools import chain
-
 from minio import S3Error
 
 import sts.logs
@@ -48,13 +46,11 @@ class MinioBucketService(BucketService):
             source_buckets[default_source_bucket] = self._create_bucket(default_source_bucket, 0)
 
         for bucket_name, bucket_settings in self._app_settings.buckets.items():
-            life_time_days = self._app_settings.buckets[bucket_name].life_time_days
-            thumbnail_buckets[bucket_name] = self._create_bucket(bucket_name, life_time_days)
+            thumbnail_buckets[bucket_name] = self._create_bucket(bucket_name, bucket_settings.life_time_days)
 
             source_bucket = bucket_settings.source_bucket
-            if source_bucket and source_bucket != default_source_bucket:
-                source_buckets[source_bucket] = self._create_bucket(bucket_settings.source_bucket, 0)
+            if source_bucket and source_bucket not in source_buckets:
+                source_buckets[source_bucket] = self._create_bucket(source_bucket, 0)
 
-        bucket_status_collection = chain(thumbnail_buckets.values(), source_buckets.values())
-        error = any(t == BucketStatus.error for t in bucket_status_collection)
+        error = BucketStatus.error in thumbnail_buckets.values() or BucketStatus.error in source_buckets.values()
         return BucketsInfo(source_buckets=source_buckets, thumbnail_buckets=thumbnail_buckets, error=error)
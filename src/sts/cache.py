@@ -0,0 +1,67 @@
+"""
+In-process caching helpers.
+"""
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from threading import Lock
+from typing import Any
+
+
+class TtlCache[K, V]:
+    """
+    Thread-safe LRU cache with per-entry time to live.
+
+    Expired entries are dropped lazily on access; when the cache is full the least recently used
+    entry is evicted.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, timer: Callable[[], float] = time.monotonic) -> None:
+        """
+        Args:
+            maxsize: Maximum number of entries (must be > 0).
+            ttl: Default time to live of an entry in seconds (must be > 0).
+            timer: Monotonic clock, used by tests.
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be > 0")
+        if ttl <= 0:
+            raise ValueError("ttl must be > 0")
+
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._timer = timer
+        self._items: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: K, default: Any = None) -> V | Any:
+        """Returns cached value or ``default`` if the key is missing or expired."""
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return default
+
+            expires_at, value = item
+            if expires_at <= self._timer():
+                del self._items[key]
+                return default
+
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """Stores value for ``ttl`` seconds, the cache default ttl is used if not set."""
+        expires_at = self._timer() + (ttl or self._ttl)
+        with self._lock:
+            self._items[key] = (expires_at, value)
+            self._items.move_to_end(key)
+            if len(self._items) > self._maxsize:
+                self._items.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        """Removes the key from cache if it exists."""
+        with self._lock:
+            self._items.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._items)
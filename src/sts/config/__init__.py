@@ -3,20 +3,24 @@ from sts.config.buckets_map import BucketsMap, create_buckets_map, get_buckets_m
 from sts.config.models import (
     AppSettings,
     BucketSettings,
+    FileCacheSettings,
     ImageSize,
     S3HttpRetries,
     S3HttpSettings,
     S3Settings,
+    StatCacheSettings,
 )
 
 __all__ = [
     # configuration models
     "AppSettings",
     "BucketSettings",
+    "FileCacheSettings",
     "ImageSize",
     "S3HttpRetries",
     "S3HttpSettings",
     "S3Settings",
+    "StatCacheSettings",
     # methods
     "get_app_settings",
     "create_buckets_map",
@@ -1,45 +1,52 @@
+from collections.abc import Mapping
+from dataclasses import dataclass
 from functools import lru_cache
-
-from pydantic import BaseModel
+from types import MappingProxyType
 
 from sts.config.loader import get_app_settings
 from sts.config.models import BucketSettings, AppSettings
 
 
-class BucketsMap(BaseModel):
-    """A mapping of buckets with metadata for bucket resolution.
+@dataclass(frozen=True, slots=True)
+class BucketsMap:
+    """A read-only mapping of buckets with metadata for bucket resolution.
 
     Attributes:
         source_bucket: The primary source bucket name.
-        buckets: Dictionary of bucket name to BucketSettings mappings.
-        all_source_buckets: Set of all source bucket names.
-        alias_map: Dictionary mapping aliases to bucket names.
+        buckets: Read-only mapping of bucket name to BucketSettings.
+        all_source_buckets: Frozen set of all source bucket names.
+        alias_map: Read-only mapping of aliases to bucket names.
     """
     source_bucket: str
-    buckets: dict[str, BucketSettings]
-    all_source_buckets: set[str]
-    alias_map: dict[str, str]
+    buckets: Mapping[str, BucketSettings]
+    all_source_buckets: frozenset[str]
+    alias_map: Mapping[str, str]
 
 
 def _build_buckets_map(settings: AppSettings) -> BucketsMap:
-    declared_sources = [s.source_bucket for s in settings.buckets.values() if s.source_bucket]
-    alias_map = {b.alias: name for name, b in settings.buckets.items() if b.alias}
-
-    if not (base_source := settings.source_bucket or (declared_sources[0] if declared_sources else None)):
+    buckets_dict: dict[str, BucketSettings] = {}
+    alias_map: dict[str, str] = {}
+    source_buckets: dict[str, None] = {}  # keeps declaration order for the base source fallback
+    for name, bucket in settings.buckets.items():
+        buckets_dict[name] = bucket
+        if bucket.alias:
+            alias_map[bucket.alias] = name
+        if bucket.source_bucket:
+            source_buckets[bucket.source_bucket] = None
+
+    if not (base_source := settings.source_bucket or next(iter(source_buckets), None)):
         raise ValueError(
             "Cannot resolve source bucket: set 'source_bucket' in AppSettings "
             "or specify 'source_bucket' for al least one bucket."
         )
-    buckets_dict = {**settings.buckets, base_source: BucketSettings(source_bucket=base_source, size=settings.size)}
-
-    if not settings.source_bucket:
-        declared_sources.append(base_source)
+    buckets_dict[base_source] = BucketSettings(source_bucket=base_source, size=settings.size)
+    source_buckets[base_source] = None
 
     return BucketsMap(
         source_bucket=base_source,
-        buckets=buckets_dict,
-        all_source_buckets=set(declared_sources),
-        alias_map=alias_map,
+        buckets=MappingProxyType(buckets_dict),
+        all_source_buckets=frozenset(source_buckets),
+        alias_map=MappingProxyType(alias_map),
     )
 
 
@@ -1,4 +1,6 @@
 import typing
+from dataclasses import dataclass, field
+from urllib.parse import unquote_plus
 
 from pydantic import BaseModel, HttpUrl, Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict, PydanticBaseSettingsSource, JsonConfigSettingsSource
@@ -7,17 +9,22 @@ from sts.config.auth import AuthSettings, AuthMode
 from sts.models.enums import ImageFormat
 
 
-class ImageSize(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ImageSize:
     """Represents the dimensions of an image with width and height.
 
         Attributes:
-            w: The width of the image in pixels. Defaults to 200.
-            h: The height of the image in pixels. Defaults to 200.
+            w: The width of the image in pixels, must be > 0. Defaults to 200.
+            h: The height of the image in pixels, must be > 0. Defaults to 200.
         """
 
     w: int = 200
     h: int = 200
 
+    def __post_init__(self) -> None:
+        if self.w <= 0 or self.h <= 0:
+            raise ValueError(f"Image size must be positive, got {self.w}x{self.h}")
+
     @classmethod
     def parse(cls, source: str) -> typing.Self:
         """Parse a string representation of image size.
@@ -29,15 +36,15 @@ class ImageSize(BaseModel):
                     An ImageSize instance with parsed dimensions.
 
                 Raises:
-                    ValueError: If the source string cannot be parsed into valid dimensions.
+                    ValueError: If the source string cannot be parsed or the dimensions are not positive.
                 """
         try:
             parts = [int(p) for p in source.split('x') if p]
-            if len(parts) == 2:
-                return cls(w=parts[0], h=parts[1])
         except ValueError:
-            pass
-        raise ValueError(f"Couldn't parse '{source}' into ImageSize")
+            parts = []
+        if len(parts) != 2:
+            raise ValueError(f"Couldn't parse '{source}' into ImageSize")
+        return cls(w=parts[0], h=parts[1])
 
 
 class S3HttpRetries(BaseModel):
@@ -47,12 +54,51 @@ class S3HttpRetries(BaseModel):
 
 
 class S3HttpSettings(BaseModel):
-    maxsize: int = 10
+    """HTTP connection pool settings of the S3 client.
+
+    Attributes:
+        maxsize: Number of kept-alive connections to the storage. Defaults to 40, the size of the request threadpool.
+        block: Wait for a free connection instead of opening a throwaway one when the pool is exhausted.
+        connect_timeout: Connection timeout in seconds. Defaults to 5.
+        read_timeout: Read timeout in seconds. Defaults to 60.
+        retries: Retry policy for failed requests.
+    """
+    maxsize: int = 40
     block: bool = False
+    connect_timeout: float = 5
+    read_timeout: float = 60
     retries: S3HttpRetries = S3HttpRetries()
 
 
-class S3Settings(BaseModel):
+class StatCacheSettings(BaseModel):
+    """Settings of the in-memory cache for file stats.
+
+    Attributes:
+        ttl_seconds: How long a file stat is kept in memory. Set to zero to disable the cache. Defaults to 10.
+        maxsize: Maximum number of cached file stats. Defaults to 10000.
+        missing_ttl_seconds: How long a missing file is remembered. Set to zero to always ask the storage.
+            Defaults to 2.
+    """
+    ttl_seconds: float = 10
+    maxsize: int = 10_000
+    missing_ttl_seconds: float = 2
+
+
+class FileCacheSettings(BaseModel):
+    """Settings of the in-memory cache for small files like thumbnails.
+
+    Attributes:
+        ttl_seconds: How long a file is kept in memory. Set to zero to disable the cache. Defaults to 60.
+        maxsize: Maximum number of cached files. Defaults to 1000.
+        max_file_size: Larger files are always streamed from the storage, in bytes. Defaults to 65536.
+    """
+    ttl_seconds: float = 60
+    maxsize: int = 1000
+    max_file_size: int = 64 * 1024
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class S3Settings:
     """Configuration settings for S3-compatible object storage.
 
     Attributes:
@@ -70,7 +116,7 @@ class S3Settings(BaseModel):
     region: str = "eu-west-1"
     use_tsl: bool = False
     trust_cert: bool = True
-    http: S3HttpSettings = S3HttpSettings()
+    http: S3HttpSettings = field(default_factory=S3HttpSettings)
 
     @classmethod
     def parse(cls, value: str) -> tuple[typing.Self, str | None]:
@@ -90,12 +136,11 @@ class S3Settings(BaseModel):
         if not s3_url.path:
             raise ValueError(f"Value '{value}' is not a valid S3 connection string")
 
-        fragments = [f for f in s3_url.path.split('/') if f]
-        if not fragments:
+        region, _, rest = s3_url.path.strip('/').partition('/')
+        if not region:
             raise ValueError(f"Url path '{s3_url.path}' doesn't contain region")
 
-        region = fragments[0]
-        source_bucket = fragments[1] if len(fragments) > 1 else None
+        source_bucket = rest.lstrip('/').partition('/')[0] or None
 
         return cls(
             endpoint=f"{s3_url.host}:{s3_url.port}",
@@ -107,7 +152,8 @@ class S3Settings(BaseModel):
         ), source_bucket
 
 
-class BucketSettings(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class BucketSettings:
     """Configuration settings for a storage bucket.
 
     Attributes:
@@ -118,7 +164,7 @@ class BucketSettings(BaseModel):
         format: The image format for this bucket. Defaults to ImageFormat.NONE.
         format_args: Additional format-specific arguments as a dictionary.
     """
-    size: ImageSize = ImageSize()
+    size: ImageSize = field(default_factory=ImageSize)
     life_time_days: int = 30
     source_bucket: str
     alias: str | None = None
@@ -137,8 +183,14 @@ class BucketSettings(BaseModel):
         """
         if not s:
             return None
-        from urllib import parse
-        return {k: v[0] for k, v in parse.parse_qs(s).items()}
+
+        # same result as parse_qs for single-valued configs: blank values are skipped, the first value wins
+        result: dict[str, str] = {}
+        for pair in s.split('&'):
+            key, _, value = pair.partition('=')
+            if value:
+                result.setdefault(unquote_plus(key), unquote_plus(value))
+        return result
 
 
 class AppSettings(BaseSettings):
@@ -152,6 +204,12 @@ class AppSettings(BaseSettings):
         log_fmt: Logging format string.
         size: Default image size. Defaults to ImageSize().
         uvicorn: Dictionary of uvicorn server settings.
+        stat_cache: File stats cache settings. Defaults to StatCacheSettings().
+        file_cache: Small files cache settings. Defaults to FileCacheSettings().
+        cache_control: Optional Cache-Control header value for file responses.
+        failed_thumbnail_ttl_seconds: How long a source file that couldn't be resized is answered with 404
+            without processing it again. Defaults to 60, zero disables it.
+        max_image_pixels: Source images with more pixels are not resized. Defaults to 50 megapixels, zero disables it.
     """
 
     s3: S3Settings = S3Settings()
@@ -162,6 +220,11 @@ class AppSettings(BaseSettings):
     size: ImageSize = ImageSize()
     uvicorn: dict[str, typing.Any] = Field(default_factory=dict)
     auth: AuthSettings = AuthSettings(mode=AuthMode.off, oidc=None)
+    stat_cache: StatCacheSettings = StatCacheSettings()
+    file_cache: FileCacheSettings = FileCacheSettings()
+    cache_control: str | None = None
+    failed_thumbnail_ttl_seconds: float = Field(default=60, ge=0)
+    max_image_pixels: int = Field(default=50_000_000, ge=0)
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -2,6 +2,8 @@
 HEADER_ETAG = "ETag"
 HEADER_LEN = "Content-Length"
 HEADER_AUTHORIZATION = "Authorization"
+HEADER_CACHE_CONTROL = "Cache-Control"
+HEADER_LAST_MODIFIED = "Last-Modified"
 
 # S3 Metadata
 META_KEY_PARENT_ETAG = "x-amz-meta-parent-etag"
@@ -2,13 +2,12 @@
 Dependency injection container configuration using Dishka.
 
 This module sets up the dependency injection container for the application,
-organizing providers into APP and REQUEST scopes for optimal resource management.
+organizing providers into scopes for optimal resource management.
 """
 from urllib.parse import urljoin
 
 from jwt import PyJWKClient
 from sts.config.auth import AuthSettings, AuthMode, OidcSettings
-import fastapi
 import loguru
 import urllib3
 from dishka import make_container, Provider, Scope, Container, AnyOf
@@ -17,7 +16,9 @@ from minio import Minio
 
 from sts.bucket_management.minio import MinioBucketService
 from sts.bucket_management.service import BucketService
-from sts.config import AppSettings, BucketsMap, create_buckets_map, S3Settings
+from sts.cache import TtlCache
+from sts.config import AppSettings, BucketsMap, create_buckets_map, get_app_settings, S3Settings
+from sts.file_storage.cached_client import CachedFileStorageClient
 from sts.file_storage.client import FileStorageClient
 from sts.file_storage.minio_client import MinioFileStorageClient
 from sts.file_storage.minio_scanner import MinioFileStorageScanner
@@ -26,18 +27,21 @@ from sts.healthcheck.reader import HealthCheckReader
 from sts.healthcheck.service import HealthCheckService
 from sts.healthcheck.writer import HealthCheckWriter
 from sts.images.lock_manager import LockManager
-from sts.images.thumbnail import ThumbnailService
-from sts.logs import ILogger
+from sts.images.thumbnail import ThumbnailService, FailedThumbnailKey, CachedFileKey, CachedFile
+from sts.models.file_storage import StorageFileItem
 from sts.security.authenticator import Authenticator
 from sts.security.extractor import TokenExtractor
 from sts.security.jwt_verifier import JWTVerifier
 from sts.security.off_jwt_verifier import OffJWTVerifier
 from sts.security.oidc_jwt_verifier import OidcJWTVerifier
 
+# Maximum number of remembered failed thumbnails
+_FAILED_THUMBNAILS_MAXSIZE = 10_000
+
 
 def _provide_app_settings() -> AppSettings:
     """Provide application settings from configuration."""
-    return AppSettings()
+    return get_app_settings()
 
 
 def _provide_auth_settings(app_settings: AppSettings) -> AuthSettings:
@@ -51,7 +55,8 @@ def _provide_token_extractor(auth: AuthSettings) -> TokenExtractor:
 
 
 def _provide_authenticator(auth: AuthSettings, verifier: JWTVerifier,
-                           token_extractor: TokenExtractor, logger: ILogger) -> Authenticator:
+                           token_extractor: TokenExtractor) -> Authenticator:
+    logger = loguru.logger.bind(source="authenticator")
     return Authenticator(auth_mode=auth.mode, verifier=verifier, token_extractor=token_extractor,
                          logger=logger)
 
@@ -71,6 +76,7 @@ def _provide_minio_client(s3_settings: S3Settings) -> Minio:
     http = urllib3.PoolManager(
         maxsize=s3_settings.http.maxsize,
         block=s3_settings.http.block,
+        timeout=urllib3.Timeout(connect=s3_settings.http.connect_timeout, read=s3_settings.http.read_timeout),
         retries=urllib3.Retry(
             total=s3_settings.http.retries.total,
             backoff_factor=s3_settings.http.retries.backoff_factor,
@@ -89,14 +95,19 @@ def _provide_minio_client(s3_settings: S3Settings) -> Minio:
     )
 
 
-def _provide_storage_client(minio: Minio) -> FileStorageClient:
-    """Provide file storage client backed by Minio."""
-    return MinioFileStorageClient(minio)
+def _provide_storage_client(minio: Minio, app_settings: AppSettings) -> FileStorageClient:
+    """Provide file storage client backed by Minio, file stats are cached in memory if enabled."""
+    storage_client = MinioFileStorageClient(minio)
 
+    stat_cache_settings = app_settings.stat_cache
+    if stat_cache_settings.ttl_seconds <= 0:
+        return storage_client
 
-def _provide_request_logger(req: fastapi.Request) -> ILogger:
-    """Provide request-scoped logger with request path context."""
-    return loguru.logger.bind(path=req.base_url.path)
+    stat_cache = TtlCache[tuple[str, str], StorageFileItem | None](
+        maxsize=stat_cache_settings.maxsize,
+        ttl=stat_cache_settings.ttl_seconds,
+    )
+    return CachedFileStorageClient(storage_client, stat_cache, missing_ttl=stat_cache_settings.missing_ttl_seconds)
 
 
 def _provide_file_storage_scanner(
@@ -110,11 +121,28 @@ def _provide_file_storage_scanner(
 def _provide_thumbnail_service(
         storage_client: FileStorageClient,
         file_storage_scanner: FileStorageScanner,
-        logger: ILogger,
         lock_manager: LockManager,
+        app_settings: AppSettings,
 ) -> ThumbnailService:
-    """Provide thumbnail generation service."""
-    return ThumbnailService(storage_client, file_storage_scanner, logger, lock_manager)
+    """Provide thumbnail generation service with bound logger."""
+    logger = loguru.logger.bind(source="thumbnail_service")
+
+    failed_thumbnails: TtlCache[FailedThumbnailKey, bool] | None = None
+    if app_settings.failed_thumbnail_ttl_seconds > 0:
+        failed_thumbnails = TtlCache(maxsize=_FAILED_THUMBNAILS_MAXSIZE,
+                                     ttl=app_settings.failed_thumbnail_ttl_seconds)
+
+    file_cache_settings = app_settings.file_cache
+    file_cache: TtlCache[CachedFileKey, CachedFile] | None = None
+    if file_cache_settings.ttl_seconds > 0:
+        file_cache = TtlCache(maxsize=file_cache_settings.maxsize, ttl=file_cache_settings.ttl_seconds)
+
+    return ThumbnailService(storage_client, file_storage_scanner, logger, lock_manager,
+                            cache_control=app_settings.cache_control,
+                            failed_thumbnails=failed_thumbnails,
+                            max_image_pixels=app_settings.max_image_pixels or None,
+                            file_cache=file_cache,
+                            max_cached_file_size=file_cache_settings.max_file_size)
 
 
 def _provide_healthcheck_service() -> AnyOf[HealthCheckReader, HealthCheckWriter]:
@@ -166,9 +194,9 @@ def _create_provider() -> Provider:
     """
     Create and configure the Dishka dependency injection provider.
 
-    Groups providers by scope:
-    - APP scope: long-lived dependencies (config, clients, services)
-    - REQUEST scope: per-request dependencies (loggers, scanners)
+    All providers are APP scoped: config, clients and services are long-lived and keep
+    no per-request state. Per-request logging context is bound by
+    :class:`sts.api.middleware.RequestContextMiddleware` instead of request-scoped loggers.
     """
     provider = Provider()
 
@@ -184,12 +212,9 @@ def _create_provider() -> Provider:
     provider.provide(_provide_lock_manager, scope=Scope.APP)
     provider.provide(_provide_jwt_verifier, scope=Scope.APP)
     provider.provide(_provide_token_extractor, scope=Scope.APP)
-
-    # Request-scoped providers
-    provider.provide(_provide_request_logger, scope=Scope.REQUEST)
-    provider.provide(_provide_file_storage_scanner, scope=Scope.REQUEST)
-    provider.provide(_provide_thumbnail_service, scope=Scope.REQUEST)
-    provider.provide(_provide_authenticator, scope=Scope.REQUEST)
+    provider.provide(_provide_file_storage_scanner, scope=Scope.APP)
+    provider.provide(_provide_authenticator, scope=Scope.APP)
+    provider.provide(_provide_thumbnail_service, scope=Scope.APP)
 
     return provider
 
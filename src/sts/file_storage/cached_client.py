@@ -0,0 +1,65 @@
+from io import BytesIO
+
+from sts.cache import TtlCache
+from sts.file_storage.client import FileStorageClient
+from sts.models.file_storage import StorageFileItem, StorageResponse
+
+# marks a key absent from the cache, cached misses are stored as None
+_NOT_CACHED = object()
+
+
+class CachedFileStorageClient(FileStorageClient):
+    """
+    Storage client decorator which keeps file stats in memory for a short time.
+
+    Every image request stats the source file and the thumbnail; with the cache, repeated requests
+    to the same file don't make a HEAD request to the storage until the entry expires. Missing files
+    are remembered for ``missing_ttl`` seconds if it's set. Uploads through this client replace the
+    cached stat of the uploaded file with the upload result.
+    """
+
+    def __init__(self, storage_client: FileStorageClient,
+                 stat_cache: TtlCache[tuple[str, str], StorageFileItem | None],
+                 missing_ttl: float = 0):
+        if not storage_client:
+            raise ValueError("storage_client is required")
+        if stat_cache is None:
+            raise ValueError("stat_cache is required")
+
+        self._storage_client = storage_client
+        self._stat_cache = stat_cache
+        self._missing_ttl = missing_ttl
+
+    # --- Reading ---
+
+    def get_file_stat(self, bucket: str, file_name: str) -> StorageFileItem | None:
+        key = (bucket, file_name)
+        cached = self._stat_cache.get(key, _NOT_CACHED)
+        if cached is not _NOT_CACHED:
+            return cached
+
+        stat = self._storage_client.get_file_stat(bucket, file_name)
+        if stat:
+            self._stat_cache.set(key, stat)
+        elif self._missing_ttl > 0:
+            self._stat_cache.set(key, None, self._missing_ttl)
+        return stat
+
+    def open_stream(self, bucket: str, file_name: str) -> StorageResponse | None:
+        return self._storage_client.open_stream(bucket, file_name)
+
+    def load_file(self, bucket: str, file_name: str) -> BytesIO | None:
+        return self._storage_client.load_file(bucket, file_name)
+
+    # --- Writing ---
+
+    def put_file(self, bucket: str, file_name: str, content: BytesIO, content_type: str,
+                 reset_content: bool = True, parent_etag: str | None = None) -> StorageFileItem:
+        result = self._storage_client.put_file(bucket, file_name, content, content_type, reset_content, parent_etag)
+        self._stat_cache.set((bucket, file_name), result)
+        return result
+
+    # --- Bucket management ---
+
+    def try_create_bucket(self, bucket: str, life_time_days: int) -> bool:
+        return self._storage_client.try_create_bucket(bucket, life_time_days)
@@ -1,5 +1,4 @@
 import os
-import shutil
 from collections.abc import Iterable
 from io import BytesIO
 
@@ -19,6 +18,7 @@ class _MinioStorageResponse(StorageResponse):
     _content_length: int
     _content_type: str
     _etag: str
+    _last_modified: str | None
 
     def __init__(self, http_response: BaseHTTPResponse):
         if not http_response:
@@ -33,6 +33,7 @@ class _MinioStorageResponse(StorageResponse):
         self._content_length = int(headers.get('content-length', '0'))
         self._content_type = headers.get('content-type', '')
         self._etag = (headers.get('etag', '')).strip('"').strip()
+        self._last_modified = headers.get('last-modified')
 
     def iter_content(self, chunk_size: int = 1024 * 512) -> Iterable[bytes]:
         if not self._http_response:
@@ -68,6 +69,10 @@ class _MinioStorageResponse(StorageResponse):
     def etag(self) -> str:
         return self._etag
 
+    @property
+    def last_modified(self) -> str | None:
+        return self._last_modified
+
 
 class MinioFileStorageClient(FileStorageClient):
     _minio_client: Minio
@@ -182,9 +187,10 @@ class MinioFileStorageClient(FileStorageClient):
 
     @staticmethod
     def _load_response_to_memory(response: BaseHTTPResponse) -> BytesIO:
-        buf = BytesIO()
         try:
-            shutil.copyfileobj(response, buf)
+            # a single read allocates the body once by its Content-Length, BytesIO then shares that buffer
+            # until it is written to, so the object is never copied or regrown in memory
+            buf = BytesIO(response.read())
             buf.seek(0, os.SEEK_END)
         finally:
             response.close()
@@ -10,4 +10,10 @@ class HealthCheckReader(ABC):
     @abstractmethod
     def bucket_info(self) -> BucketsInfo:
         """Bucket information required for health check validation."""
-        ...
\ No newline at end of file
+        ...
+
+    @property
+    @abstractmethod
+    def bucket_info_json(self) -> bytes:
+        """Bucket information serialized to JSON, the value is computed once when the information is set."""
+        ...
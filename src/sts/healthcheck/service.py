@@ -1,18 +1,29 @@
+from pydantic import TypeAdapter
+
 from sts.healthcheck.reader import HealthCheckReader
 from sts.healthcheck.writer import HealthCheckWriter
 from sts.models.bucket import BucketsInfo
 
+_buckets_info_adapter = TypeAdapter(BucketsInfo)
+
 
 class HealthCheckService(HealthCheckReader, HealthCheckWriter):
     _buckets_info: BucketsInfo | None = None
+    _buckets_info_json: bytes | None = None
 
     def set_buckets_info(self, buckets_info: BucketsInfo):
         assert buckets_info, "buckets_info is required"
         assert self._buckets_info is None, "buckets_info is readonly"
 
         self._buckets_info = buckets_info
+        self._buckets_info_json = _buckets_info_adapter.dump_json(buckets_info)
 
     @property
     def bucket_info(self) -> BucketsInfo:
         assert self._buckets_info, "set_buckets_info() was not called"
         return self._buckets_info
+
+    @property
+    def bucket_info_json(self) -> bytes:
+        assert self._buckets_info_json, "set_buckets_info() was not called"
+        return self._buckets_info_json
@@ -1,18 +1,29 @@
-from contextlib import asynccontextmanager
+"""
+Web application factory.
+
+Routers, the dependency container and their imports are only loaded when the application is created,
+so importing this module stays cheap. Uvicorn runs the app through ``sts.host:create_app`` with
+``factory=True``; ``sts.host.app`` is still available and is created on first access.
+"""
+from __future__ import annotations
 
-from dishka.integrations.fastapi import setup_dishka
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from functools import cache
+from typing import Any, TYPE_CHECKING
 
-from sts.api.hc import hc_router
-from sts.api.images import images_router
-from sts.bucket_management.service import BucketService
-from sts.config import AppSettings
-from sts.container import container
-from sts.healthcheck.writer import HealthCheckWriter
-from sts.logs import configure_logger
+if TYPE_CHECKING:
+    from fastapi import FastAPI
 
 
 def _prepare_application() -> None:
+    from PIL import Image
+
+    from sts.bucket_management.service import BucketService
+    from sts.config import AppSettings
+    from sts.container import container
+    from sts.healthcheck.writer import HealthCheckWriter
+    from sts.logs import configure_logger
+
     app_settings = container.get(AppSettings)
     configure_logger(app_settings)
 
@@ -22,14 +33,43 @@ def _prepare_application() -> None:
     hc_service = container.get(HealthCheckWriter)
     hc_service.set_buckets_info(bucket_info)
 
+    # register all image plugins now instead of on the first thumbnail request
+    Image.init()
+
 
 @asynccontextmanager
 async def _app_lifespan(_: FastAPI):
+    from sts.container import container
+
     _prepare_application()
     yield
     container.close()
 
-app = FastAPI(lifespan=_app_lifespan)
-app.include_router(images_router)
-app.include_router(hc_router)
-setup_dishka(container, app)
+
+def create_app() -> FastAPI:
+    """Creates the web application with routers, middlewares and dependency injection configured."""
+    from dishka.integrations.fastapi import setup_dishka
+    from fastapi import FastAPI
+
+    from sts.api.hc import hc_router
+    from sts.api.images import images_router
+    from sts.api.middleware import RequestContextMiddleware
+    from sts.container import container
+
+    app = FastAPI(lifespan=_app_lifespan)
+    app.include_router(images_router)
+    app.include_router(hc_router)
+    app.add_middleware(RequestContextMiddleware)
+    setup_dishka(container, app)
+    return app
+
+
+@cache
+def _get_app() -> FastAPI:
+    return create_app()
+
+
+def __getattr__(name: str) -> Any:
+    if name == "app":
+        return _get_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,11 @@
+from dataclasses import dataclass
+
 from fastapi import status
 from fastapi.responses import Response, StreamingResponse, JSONResponse
 from starlette.background import BackgroundTask
 
-from sts.constants import HEADER_ETAG, HEADER_LEN
+from sts.cache import TtlCache
+from sts.constants import HEADER_ETAG, HEADER_LEN, HEADER_CACHE_CONTROL, HEADER_LAST_MODIFIED
 from sts.config import BucketSettings
 from sts.file_storage.client import FileStorageClient
 from sts.file_storage.scanner import FileStorageScanner
@@ -10,13 +13,28 @@ from sts.images.lock_manager import LockManager
 from sts.images.processor import resize_image
 from sts.logs import ILogger
 from sts.models.file_storage import ScanResultFileFound, ScanResultCreateNew
-from sts.models.file_storage import StorageFileItem, ScanResultNotFound, ScanResultUseSourceFile
+from sts.models.file_storage import StorageFileItem, ScanResultNotFound, ScanResultUseSourceFile, StorageResponse
 
 _NOT_FOUND_RESPONSE: JSONResponse = JSONResponse(
     status_code=status.HTTP_404_NOT_FOUND,
     content={"detail": "File not found"},
 )
 
+# key of a failed thumbnail: thumbnail bucket, file name and source file etag
+type FailedThumbnailKey = tuple[str, str, str]
+
+# key of a cached file: bucket, file name and file etag
+type CachedFileKey = tuple[str, str, str]
+
+
+@dataclass(frozen=True, slots=True)
+class CachedFile:
+    """Small file kept in memory to answer without a storage request."""
+    content_type: str
+    etag: str
+    body: bytes
+    last_modified: str | None = None
+
 
 class ThumbnailService:
     """Handles thumbnail retrieval, creation, and storage responses."""
@@ -27,6 +45,11 @@ class ThumbnailService:
             file_storage_scanner: FileStorageScanner,
             logger: ILogger,
             lock_manager: LockManager,
+            cache_control: str | None = None,
+            failed_thumbnails: TtlCache[FailedThumbnailKey, bool] | None = None,
+            max_image_pixels: int | None = None,
+            file_cache: TtlCache[CachedFileKey, CachedFile] | None = None,
+            max_cached_file_size: int = 0,
     ) -> None:
         if not storage_client:
             raise ValueError("storage_client is required")
@@ -41,6 +64,11 @@ class ThumbnailService:
         self._storage_client = storage_client
         self._file_storage_scanner = file_storage_scanner
         self._logger = logger
+        self._cache_headers = {HEADER_CACHE_CONTROL: cache_control} if cache_control else {}
+        self._failed_thumbnails = failed_thumbnails
+        self._max_image_pixels = max_image_pixels
+        self._file_cache = file_cache
+        self._max_cached_file_size = max_cached_file_size
 
     def get_thumbnail(self, bucket: str, file_name: str, etag: str | None) -> Response:
         """Retrieves an existing thumbnail, the source file, or creates a new thumbnail."""
@@ -86,6 +114,10 @@ class ThumbnailService:
                           bucket_settings: BucketSettings,
                           bucket: str) -> Response:
 
+        failed_key = (bucket, source_file_stat.file_name, source_file_stat.etag)
+        if self._is_failed_thumbnail(failed_key):
+            return _NOT_FOUND_RESPONSE
+
         lock_key = f"{source_file_stat.bucket}/{source_file_stat.file_name}@{bucket}"
         with self._lock_manager.acquire(lock_key):
             self._logger.debug(f"Processing thumbnail lock acquired for {lock_key}")
@@ -96,6 +128,10 @@ class ThumbnailService:
                 self._logger.debug(f"Thumbnail '{lock_key}' already exists (was created while waiting)")
                 return self._get_file_response(existing, None)
 
+            # the same for failures: requests queued on the lock must not decode the bad source again
+            if self._is_failed_thumbnail(failed_key):
+                return _NOT_FOUND_RESPONSE
+
             return self._create_thumbnail_and_upload(
                 source_file_stat=source_file_stat,
                 bucket_settings=bucket_settings,
@@ -107,7 +143,7 @@ class ThumbnailService:
             source_file_stat: StorageFileItem,
             bucket_settings: BucketSettings,
             bucket: str) -> Response:
-        """Loads source, resizes it, uploads it to storage, and returns a streaming response."""
+        """Loads source, resizes it, uploads it to storage, and returns the thumbnail bytes."""
         image_data = self._storage_client.load_file(bucket=source_file_stat.bucket,
                                                     file_name=source_file_stat.file_name)
         if not image_data:
@@ -116,9 +152,13 @@ class ThumbnailService:
 
         thumbnail = resize_image(image_data,
                                  bucket_settings.size.w, bucket_settings.size.h,
-                                 bucket_settings.format, bucket_settings.format_args)
+                                 bucket_settings.format, bucket_settings.format_args,
+                                 max_pixels=self._max_image_pixels)
         if thumbnail.error or not thumbnail.data:
             self._logger.warning(f"Failed to create thumbnail: {thumbnail.error}")
+            if self._failed_thumbnails is not None:
+                # the same source file fails the same way, don't load and decode it again on every request
+                self._failed_thumbnails.set((bucket, source_file_stat.file_name, source_file_stat.etag), True)
             return _NOT_FOUND_RESPONSE
 
         put_result = self._storage_client.put_file(
@@ -130,24 +170,34 @@ class ThumbnailService:
         )
         self._logger.debug("Thumbnail was uploaded to storage")
 
-        return StreamingResponse(
-            thumbnail.data,
-            media_type=thumbnail.content_type,
-            headers={HEADER_ETAG: put_result.etag, HEADER_LEN: str(put_result.size)},
-        )
+        # the thumbnail is already in memory: send it as a single body, Content-Length is set by the response
+        cached_file = CachedFile(content_type=thumbnail.content_type, etag=put_result.etag,
+                                 body=thumbnail.data.getvalue())
+        if self._file_cache is not None and self._can_cache_file(len(cached_file.body)):
+            self._file_cache.set((bucket, put_result.file_name, put_result.etag), cached_file)
+        return self._get_cached_file_response(cached_file)
 
     def _get_file_response(self, file_storage_item: StorageFileItem, etag: str | None) -> Response:
         """Streams an existing file from storage, respecting Etag/304 caching."""
         if etag and file_storage_item.etag == etag:
-            headers = {HEADER_ETAG: etag}
+            headers = {HEADER_ETAG: etag, **self._cache_headers}
             return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
 
+        if self._can_cache_file(file_storage_item.size):
+            return self._get_small_file_response(file_storage_item)
+
         stream = self._storage_client.open_stream(file_storage_item.bucket, file_storage_item.file_name)
         if not stream:
             return _NOT_FOUND_RESPONSE
 
+        return self._get_stream_response(stream)
+
+    def _get_stream_response(self, stream: StorageResponse) -> Response:
+        """Streams an opened storage response, the stream is closed after the response is sent."""
         background_task = BackgroundTask(stream.close)
-        headers = {HEADER_ETAG: stream.etag, HEADER_LEN: str(stream.content_length)}
+        headers = {HEADER_ETAG: stream.etag, HEADER_LEN: str(stream.content_length), **self._cache_headers}
+        if stream.last_modified:
+            headers[HEADER_LAST_MODIFIED] = stream.last_modified
 
         return StreamingResponse(
             stream.iter_content(1024 * 512),
@@ -155,3 +205,64 @@ class ThumbnailService:
             headers=headers,
             background=background_task,
         )
+
+    def _is_failed_thumbnail(self, failed_key: FailedThumbnailKey) -> bool:
+        if self._failed_thumbnails is None or not self._failed_thumbnails.get(failed_key):
+            return False
+
+        self._logger.debug(f"Thumbnail for {failed_key[0]}/{failed_key[1]} failed recently, return 404")
+        return True
+
+    def _can_cache_file(self, size: int) -> bool:
+        return self._file_cache is not None and 0 < size <= self._max_cached_file_size
+
+    def _get_small_file_response(self, file_storage_item: StorageFileItem) -> Response:
+        """Answers a small file from the memory cache, loads and caches it on a miss."""
+        assert self._file_cache is not None
+        key = (file_storage_item.bucket, file_storage_item.file_name, file_storage_item.etag)
+        cached_file = self._file_cache.get(key)
+        if cached_file:
+            return self._get_cached_file_response(cached_file)
+
+        stream = self._storage_client.open_stream(file_storage_item.bucket, file_storage_item.file_name)
+        if not stream:
+            return _NOT_FOUND_RESPONSE
+
+        # the stat may be stale, the file could be replaced with a large one: stream it without caching
+        if stream.content_length > self._max_cached_file_size:
+            return self._get_stream_response(stream)
+
+        try:
+            body = self._read_small_file(stream)
+        finally:
+            stream.close()
+
+        # iter_content stops on read errors, never serve or cache a cut-short body under the real etag
+        if body is None or len(body) != stream.content_length:
+            self._logger.warning(f"Failed to read {file_storage_item.bucket}/{file_storage_item.file_name}: "
+                                 f"expected {stream.content_length} bytes")
+            return _NOT_FOUND_RESPONSE
+
+        cached_file = CachedFile(content_type=stream.content_type, etag=stream.etag, body=body,
+                                 last_modified=stream.last_modified)
+        # the file could be replaced after the stat, cache it under the etag it was actually read with
+        self._file_cache.set((file_storage_item.bucket, file_storage_item.file_name, cached_file.etag), cached_file)
+        return self._get_cached_file_response(cached_file)
+
+    def _read_small_file(self, stream: StorageResponse) -> bytes | None:
+        """Reads the whole stream, returns None if it's larger than the cached file size limit."""
+        chunks: list[bytes] = []
+        size = 0
+        for chunk in stream.iter_content(self._max_cached_file_size):
+            size += len(chunk)
+            if size > self._max_cached_file_size:
+                return None
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    def _get_cached_file_response(self, cached_file: CachedFile) -> Response:
+        headers = {HEADER_ETAG: cached_file.etag, **self._cache_headers}
+        if cached_file.last_modified:
+            headers[HEADER_LAST_MODIFIED] = cached_file.last_modified
+
+        return Response(content=cached_file.body, media_type=cached_file.content_type, headers=headers)
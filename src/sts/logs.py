@@ -1,4 +1,5 @@
 import sys
+from contextvars import ContextVar, Token
 from typing import Protocol, Any
 
 from loguru import logger
@@ -16,16 +17,43 @@ class ILogger(Protocol):
     def warning(self, message: str, *args: Any, **kwargs: Any) -> None: pass
 
 
+_request_context: ContextVar[dict[str, Any] | None] = ContextVar("request_context", default=None)
+
+
+def set_request_context(**extra: Any) -> Token:
+    """
+    Sets extra values which are added to every log record of the current request.
+    :param extra: Values to add to the record's extra
+    :return: Token to restore the previous context with reset_request_context()
+    """
+    return _request_context.set(extra)
+
+
+def reset_request_context(token: Token) -> None:
+    """ Restores request context which was active before set_request_context() call """
+    _request_context.reset(token)
+
+
+def _patch_request_context(record: Any) -> None:
+    if extra := _request_context.get():
+        record["extra"].update(extra)
+
+
 def configure_logger(app_settings: AppSettings) -> None:
     """
     Setups logging configuration for the app. This method removes all default settings and adds new handlers:
-    to console and to file. Log files are saved to logs/log_{time}.log files with retentiotion for 10 days.
+    to console and to file. Log files are saved to logs/log_{time}.log files, rotated by size and compressed,
+    the last 10 files are kept. All sinks are enqueued, so log calls from request handlers don't block on I/O.
     :param app_settings: Application settings
     :return: None
     """
 
+    level = app_settings.log_level.upper()
+    fmt = app_settings.log_fmt
+
     logger.remove()
-    logger.add(sys.stdout, level=app_settings.log_level.upper(), format=app_settings.log_fmt)
-    logger.add(sys.stderr, level="ERROR", format=app_settings.log_fmt)
-    logger.add("logs/log_{time}.log", level=app_settings.log_level.upper(), retention="10 days",
-               format=app_settings.log_fmt)
+    logger.configure(patcher=_patch_request_context)
+    logger.add(sys.stdout, level=level, format=fmt, enqueue=True, backtrace=False, diagnose=False)
+    logger.add(sys.stderr, level="ERROR", format=fmt, enqueue=True, backtrace=False, diagnose=False)
+    logger.add("logs/log_{time}.log", level=level, format=fmt, enqueue=True, backtrace=False, diagnose=False,
+               rotation="50 MB", retention=10, compression="gz")
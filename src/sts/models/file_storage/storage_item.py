@@ -49,3 +49,9 @@ class StorageResponse(ABC):
     @abstractmethod
     def etag(self) -> str:
         ...
+
+    @property
+    @abstractmethod
+    def last_modified(self) -> str | None:
+        """Value of Last-Modified header returned by storage (HTTP date), if any."""
+        ...
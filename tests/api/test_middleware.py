@@ -0,0 +1,45 @@
+import asyncio
+
+from sts.api.middleware import RequestContextMiddleware
+from sts.logs import _request_context
+
+
+async def _noop_receive():
+    return {"type": "http.request"}
+
+
+async def _noop_send(_):
+    pass
+
+
+def test_request_context_is_bound_while_request_is_handled():
+    # arrange
+    captured = []
+
+    async def app(scope, receive, send):
+        captured.append(_request_context.get())
+
+    middleware = RequestContextMiddleware(app)
+
+    # act
+    asyncio.run(middleware({"type": "http", "path": "/images/icon.png"}, _noop_receive, _noop_send))
+
+    # assert
+    assert captured == [{"path": "/images/icon.png"}]
+    assert _request_context.get() is None
+
+
+def test_request_context_is_not_bound_for_lifespan():
+    # arrange
+    captured = []
+
+    async def app(scope, receive, send):
+        captured.append(_request_context.get())
+
+    middleware = RequestContextMiddleware(app)
+
+    # act
+    asyncio.run(middleware({"type": "lifespan"}, _noop_receive, _noop_send))
+
+    # assert
+    assert captured == [None]
@@ -1,4 +1,6 @@
-from sts.config import get_app_settings, get_buckets_map, ImageSize, BucketSettings
+import pytest
+
+from sts.config import get_app_settings, get_buckets_map, ImageSize, BucketSettings, S3Settings, AppSettings
 from sts.models.enums import ImageFormat
 
 
@@ -105,3 +107,56 @@ def test_uvicorn_defaults():
     assert app_settings.uvicorn['port'] == 80
     assert app_settings.uvicorn['proxy_headers'] == True
     assert app_settings.uvicorn['workers'] == 4
+
+
+@pytest.mark.parametrize('url, expected_region, expected_source_bucket', [
+    ('http://ak:sk@localhost:9000/eu-west-1/images', 'eu-west-1', 'images'),
+    ('http://ak:sk@localhost:9000/eu-west-1/images/', 'eu-west-1', 'images'),
+    ('http://ak:sk@localhost:9000/eu-west-1', 'eu-west-1', None),
+    ('http://ak:sk@localhost:9000/eu-west-1/', 'eu-west-1', None),
+])
+def test_s3_settings_parse(url: str, expected_region: str, expected_source_bucket: str | None):
+    # arrange & act
+    s3_settings, source_bucket = S3Settings.parse(url)
+
+    # assert
+    assert s3_settings.region == expected_region
+    assert s3_settings.endpoint == 'localhost:9000'
+    assert source_bucket == expected_source_bucket
+
+
+def test_s3_settings_parse_without_region():
+    # arrange, act & assert
+    with pytest.raises(ValueError):
+        S3Settings.parse('http://ak:sk@localhost:9000/')
+
+
+@pytest.mark.parametrize('source', ['0x100', '100x0', '-5x100'])
+def test_image_size_parse_non_positive(source: str):
+    # arrange, act & assert
+    with pytest.raises(ValueError, match='must be positive'):
+        ImageSize.parse(source)
+
+
+@pytest.mark.parametrize('source', ['100', '100x', 'axb', '1x2x3'])
+def test_image_size_parse_invalid(source: str):
+    # arrange, act & assert
+    with pytest.raises(ValueError, match="Couldn't parse"):
+        ImageSize.parse(source)
+
+
+@pytest.mark.parametrize('source, expected', [
+    ('alias=image&size=200x200&source_bucket=images', {'alias': 'image', 'size': '200x200', 'source_bucket': 'images'}),
+    ('alias=first&alias=second', {'alias': 'first'}),
+    ('alias=&size=10x10&broken', {'size': '10x10'}),
+    ('alias=my%20image+small', {'alias': 'my image small'}),
+])
+def test_bucket_settings_parse(source: str, expected: dict):
+    # arrange, act & assert
+    assert BucketSettings.parse(source) == expected
+
+
+def test_failed_thumbnail_ttl_must_not_be_negative():
+    # arrange, act & assert
+    with pytest.raises(ValueError):
+        AppSettings(failed_thumbnail_ttl_seconds=-1)
@@ -0,0 +1,74 @@
+from io import BytesIO
+from unittest.mock import create_autospec
+
+from sts.cache import TtlCache
+from sts.file_storage.cached_client import CachedFileStorageClient
+from sts.file_storage.client import FileStorageClient
+from sts.models.file_storage import StorageFileItem
+
+_stat = StorageFileItem(bucket='images', file_name='icon.png', size=1024, content_type='image/png', etag='abc')
+
+
+def _create_client(missing_ttl: float = 0) -> tuple[CachedFileStorageClient, FileStorageClient]:
+    storage_client_mock = create_autospec(FileStorageClient)
+    storage_client_mock.get_file_stat.return_value = _stat
+    storage_client_mock.put_file.return_value = _stat
+    client = CachedFileStorageClient(storage_client_mock, TtlCache(maxsize=10, ttl=60), missing_ttl=missing_ttl)
+    return client, storage_client_mock
+
+
+def test_get_file_stat_is_cached():
+    # arrange
+    client, storage_client_mock = _create_client()
+
+    # act
+    first = client.get_file_stat('images', 'icon.png')
+    second = client.get_file_stat('images', 'icon.png')
+
+    # assert
+    assert first is _stat
+    assert second is _stat
+    storage_client_mock.get_file_stat.assert_called_once_with('images', 'icon.png')
+
+
+def test_get_file_stat_missing_file_is_not_cached():
+    # arrange
+    client, storage_client_mock = _create_client()
+    storage_client_mock.get_file_stat.return_value = None
+
+    # act
+    client.get_file_stat('images', 'icon.png')
+    client.get_file_stat('images', 'icon.png')
+
+    # assert
+    assert storage_client_mock.get_file_stat.call_count == 2
+
+
+def test_get_file_stat_missing_file_is_cached_with_missing_ttl():
+    # arrange
+    client, storage_client_mock = _create_client(missing_ttl=5)
+    storage_client_mock.get_file_stat.return_value = None
+
+    # act
+    first = client.get_file_stat('images', 'icon.png')
+    second = client.get_file_stat('images', 'icon.png')
+
+    # assert
+    assert first is None
+    assert second is None
+    storage_client_mock.get_file_stat.assert_called_once_with('images', 'icon.png')
+
+
+def test_put_file_replaces_cached_stat():
+    # arrange
+    client, storage_client_mock = _create_client(missing_ttl=5)
+    storage_client_mock.get_file_stat.return_value = None
+    client.get_file_stat('images', 'icon.png')
+
+    # act
+    client.put_file('images', 'icon.png', BytesIO(b'data'), 'image/png')
+    stat = client.get_file_stat('images', 'icon.png')
+
+    # assert
+    assert stat is _stat
+    storage_client_mock.get_file_stat.assert_called_once_with('images', 'icon.png')
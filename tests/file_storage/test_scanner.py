@@ -15,7 +15,7 @@ _buckets = {
                                        life_time_days=30)}
 _buckets_map = BucketsMap(source_bucket="images", buckets=_buckets,
                           alias_map={'small': 'thumbnail-small', 'medium': 'thumbnail-medium'},
-                          all_source_buckets={'images'})
+                          all_source_buckets=frozenset({'images'}))
 _default_storage_client_mock = create_autospec(FileStorageClient)
 _default_storage_client_mock.get_file_stat.return_value = StorageFileItem('unit',
                                                                           '../test.png',
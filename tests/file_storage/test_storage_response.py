@@ -5,10 +5,12 @@ from sts.file_storage.minio_client import _MinioStorageResponse
 _expected_content_length = '1024'
 _expected_content_type = 'image/png'
 _expected_etag = '53e2a123b39d45339b7d6f14b99292b8'
+_expected_last_modified = 'Wed, 21 Oct 2015 07:28:00 GMT'
 
 _fake_response = HTTPResponse(body='', headers={'content-length': _expected_content_length,
                                                 'content-type': _expected_content_type,
-                                                'etag': f'"{_expected_etag}"'
+                                                'etag': f'"{_expected_etag}"',
+                                                'last-modified': _expected_last_modified,
                                                 }, status=200, version=1, version_string='1', reason=None,
                               decode_content=False, request_url='http://minio/images/icon.png')
 
@@ -21,3 +23,4 @@ def test_storage_response_init_successful():
     assert storage_response.etag == _expected_etag
     assert storage_response.content_type == _expected_content_type
     assert storage_response.content_length == int(_expected_content_length)
+    assert storage_response.last_modified == _expected_last_modified
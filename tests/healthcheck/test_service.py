@@ -0,0 +1,24 @@
+import json
+
+from sts.healthcheck.service import HealthCheckService
+from sts.models.bucket import BucketsInfo
+from sts.models.enums import BucketStatus
+
+
+def test_set_buckets_info_serializes_json():
+    # arrange
+    service = HealthCheckService()
+    buckets_info = BucketsInfo(source_buckets={'images': BucketStatus.exists},
+                               thumbnail_buckets={'images-small': BucketStatus.created},
+                               error=False)
+
+    # act
+    service.set_buckets_info(buckets_info)
+
+    # assert
+    assert service.bucket_info is buckets_info
+    assert json.loads(service.bucket_info_json) == {
+        'source_buckets': {'images': 'exists'},
+        'thumbnail_buckets': {'images-small': 'created'},
+        'error': False,
+    }
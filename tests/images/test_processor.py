@@ -44,3 +44,24 @@ def test_resize_image_png2jpeg() -> None:
             assert image.size[1] == 100
             assert image.mode == _mode_rgb
             assert image.get_format_mimetype() == _mime_jpeg
+
+
+def test_resize_image_jpeg_baseline() -> None:
+    file_data = __read_file('test.png')
+    resize_result = resize_image(file_data, 100, 100, image_format=ImageFormat.JPEG)
+
+    assert not resize_result.error
+    assert resize_result.data
+
+    with resize_result.data:
+        with Image.open(resize_result.data) as image:
+            assert not image.info.get('progressive')
+
+
+def test_resize_image_too_many_pixels() -> None:
+    file_data = __read_file('test.png')
+    resize_result = resize_image(file_data, 100, 100, max_pixels=100)
+
+    assert resize_result.error
+    assert resize_result.content_type == _mime_png
+    assert not resize_result.data
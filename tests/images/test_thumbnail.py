@@ -0,0 +1,225 @@
+from io import BytesIO
+from unittest.mock import create_autospec, Mock
+
+from PIL import Image
+from starlette.responses import StreamingResponse
+
+from sts.cache import TtlCache
+from sts.config import BucketSettings, ImageSize
+from sts.file_storage.client import FileStorageClient
+from sts.file_storage.scanner import FileStorageScanner
+from sts.images.lock_manager import LockManager
+from sts.images.thumbnail import ThumbnailService
+from sts.models.file_storage import StorageFileItem, StorageResponse, ScanResultUseSourceFile, ScanResultCreateNew
+
+_cache_control = 'public, max-age=60'
+_source_stat = StorageFileItem(bucket='images', file_name='icon.png', size=4, content_type='image/png', etag='abc')
+
+
+def _read_file(file_name: str) -> BytesIO:
+    with open(file_name, 'rb') as file_data:
+        return BytesIO(file_data.read())
+
+
+def _create_service(storage_client: FileStorageClient, scanner: FileStorageScanner) -> ThumbnailService:
+    return ThumbnailService(storage_client, scanner, Mock(), LockManager(), cache_control=_cache_control)
+
+
+def _create_scanner(scan_result) -> FileStorageScanner:
+    scanner_mock = create_autospec(FileStorageScanner)
+    scanner_mock.scan_file.return_value = scan_result
+    return scanner_mock
+
+
+def test_get_thumbnail_not_modified():
+    # arrange
+    storage_client_mock = create_autospec(FileStorageClient)
+    service = _create_service(storage_client_mock, _create_scanner(ScanResultUseSourceFile(_source_stat)))
+
+    # act
+    response = service.get_thumbnail('images', 'icon.png', 'abc')
+
+    # assert
+    assert response.status_code == 304
+    assert response.headers['etag'] == 'abc'
+    assert response.headers['cache-control'] == _cache_control
+    storage_client_mock.open_stream.assert_not_called()
+
+
+def test_get_thumbnail_streams_file():
+    # arrange
+    stream_mock = create_autospec(StorageResponse, instance=True)
+    stream_mock.etag = 'abc'
+    stream_mock.content_length = 4
+    stream_mock.content_type = 'image/png'
+    stream_mock.last_modified = 'Wed, 21 Oct 2015 07:28:00 GMT'
+    storage_client_mock = create_autospec(FileStorageClient)
+    storage_client_mock.open_stream.return_value = stream_mock
+    service = _create_service(storage_client_mock, _create_scanner(ScanResultUseSourceFile(_source_stat)))
+
+    # act
+    response = service.get_thumbnail('images', 'icon.png', 'other')
+
+    # assert
+    assert response.status_code == 200
+    assert response.headers['etag'] == 'abc'
+    assert response.headers['content-length'] == '4'
+    assert response.headers['cache-control'] == _cache_control
+    assert response.headers['last-modified'] == 'Wed, 21 Oct 2015 07:28:00 GMT'
+
+
+def test_get_thumbnail_creates_new():
+    # arrange
+    thumbnail_stat = StorageFileItem(bucket='images-small', file_name='icon.png', size=1, content_type='image/png',
+                                     etag='def', parent_etag='abc')
+    storage_client_mock = create_autospec(FileStorageClient)
+    storage_client_mock.get_file_stat.return_value = None
+    storage_client_mock.load_file.return_value = _read_file('test.png')
+    storage_client_mock.put_file.return_value = thumbnail_stat
+    scan_result = ScanResultCreateNew(source_file_stat=_source_stat,
+                                      bucket_settings=BucketSettings(source_bucket='images', size=ImageSize(w=10, h=10)))
+    service = _create_service(storage_client_mock, _create_scanner(scan_result))
+
+    # act
+    response = service.get_thumbnail('images-small', 'icon.png', None)
+
+    # assert
+    assert response.status_code == 200
+    assert response.headers['etag'] == 'def'
+    assert response.headers['content-type'] == 'image/png'
+    assert int(response.headers['content-length']) == len(response.body)
+    with Image.open(BytesIO(response.body)) as image:
+        assert image.size == (10, 10)
+
+
+def test_get_thumbnail_remembers_failed_source():
+    # arrange
+    storage_client_mock = create_autospec(FileStorageClient)
+    storage_client_mock.get_file_stat.return_value = None
+    storage_client_mock.load_file.return_value = BytesIO(b'not an image')
+    scan_result = ScanResultCreateNew(source_file_stat=_source_stat,
+                                      bucket_settings=BucketSettings(source_bucket='images', size=ImageSize(w=10, h=10)))
+    service = ThumbnailService(storage_client_mock, _create_scanner(scan_result), Mock(), LockManager(),
+                               failed_thumbnails=TtlCache(maxsize=10, ttl=60))
+
+    # act
+    first_response = service.get_thumbnail('images-small', 'icon.png', None)
+    second_response = service.get_thumbnail('images-small', 'icon.png', None)
+
+    # assert
+    assert first_response.status_code == 404
+    assert second_response.status_code == 404
+    storage_client_mock.load_file.assert_called_once()
+    storage_client_mock.put_file.assert_not_called()
+
+
+def test_get_thumbnail_checks_failed_source_after_lock():
+    # arrange
+    failed_thumbnails = TtlCache(maxsize=10, ttl=60)
+
+    def fail_while_waiting(bucket: str, file_name: str) -> None:
+        # another request failed on the same source while this one waited for the lock
+        failed_thumbnails.set((bucket, file_name, _source_stat.etag), True)
+
+    storage_client_mock = create_autospec(FileStorageClient)
+    storage_client_mock.get_file_stat.side_effect = fail_while_waiting
+    scan_result = ScanResultCreateNew(source_file_stat=_source_stat,
+                                      bucket_settings=BucketSettings(source_bucket='images', size=ImageSize(w=10, h=10)))
+    service = ThumbnailService(storage_client_mock, _create_scanner(scan_result), Mock(), LockManager(),
+                               failed_thumbnails=failed_thumbnails)
+
+    # act
+    response = service.get_thumbnail('images-small', 'icon.png', None)
+
+    # assert
+    assert response.status_code == 404
+    storage_client_mock.load_file.assert_not_called()
+
+
+def _create_stream(content_length: int, chunks: list[bytes]) -> StorageResponse:
+    stream_mock = create_autospec(StorageResponse, instance=True)
+    stream_mock.etag = 'abc'
+    stream_mock.content_type = 'image/png'
+    stream_mock.content_length = content_length
+    stream_mock.last_modified = None
+    stream_mock.iter_content.side_effect = lambda chunk_size: iter(chunks)
+    return stream_mock
+
+
+def _create_service_with_file_cache(storage_client: FileStorageClient) -> ThumbnailService:
+    return ThumbnailService(storage_client, _create_scanner(ScanResultUseSourceFile(_source_stat)), Mock(),
+                            LockManager(), file_cache=TtlCache(maxsize=10, ttl=60), max_cached_file_size=8)
+
+
+def test_get_thumbnail_small_file_is_cached():
+    # arrange
+    stream_mock = _create_stream(4, [b'da', b'ta'])
+    storage_client_mock = create_autospec(FileStorageClient)
+    storage_client_mock.open_stream.return_value = stream_mock
+    service = _create_service_with_file_cache(storage_client_mock)
+
+    # act
+    first_response = service.get_thumbnail('images', 'icon.png', None)
+    second_response = service.get_thumbnail('images', 'icon.png', None)
+
+    # assert
+    assert first_response.body == b'data'
+    assert second_response.body == b'data'
+    assert second_response.headers['etag'] == 'abc'
+    assert second_response.headers['content-type'] == 'image/png'
+    storage_client_mock.open_stream.assert_called_once_with('images', 'icon.png')
+    stream_mock.close.assert_called_once()
+
+
+def test_get_thumbnail_cut_short_file_is_not_served():
+    # arrange
+    stream_mock = _create_stream(8, [b'da', b'ta'])
+    storage_client_mock = create_autospec(FileStorageClient)
+    storage_client_mock.open_stream.return_value = stream_mock
+    service = _create_service_with_file_cache(storage_client_mock)
+
+    # act
+    first_response = service.get_thumbnail('images', 'icon.png', None)
+    second_response = service.get_thumbnail('images', 'icon.png', None)
+
+    # assert
+    assert first_response.status_code == 404
+    assert second_response.status_code == 404
+    assert storage_client_mock.open_stream.call_count == 2
+
+
+def test_get_thumbnail_replaced_large_file_is_streamed():
+    # arrange
+    stream_mock = _create_stream(1024, [b'x' * 1024])
+    storage_client_mock = create_autospec(FileStorageClient)
+    storage_client_mock.open_stream.return_value = stream_mock
+    service = _create_service_with_file_cache(storage_client_mock)
+
+    # act
+    first_response = service.get_thumbnail('images', 'icon.png', None)
+    service.get_thumbnail('images', 'icon.png', None)
+
+    # assert
+    assert isinstance(first_response, StreamingResponse)
+    assert first_response.headers['content-length'] == '1024'
+    assert storage_client_mock.open_stream.call_count == 2
+    stream_mock.close.assert_not_called()
+
+
+def test_get_thumbnail_file_larger_than_its_length_is_not_read_fully():
+    # arrange
+    chunks = [b'data', b'data', b'data', b'data']
+    stream_mock = _create_stream(4, chunks)
+    stream_mock.iter_content.side_effect = None
+    stream_mock.iter_content.return_value = iter(chunks)
+    storage_client_mock = create_autospec(FileStorageClient)
+    storage_client_mock.open_stream.return_value = stream_mock
+    service = _create_service_with_file_cache(storage_client_mock)
+
+    # act
+    response = service.get_thumbnail('images', 'icon.png', None)
+
+    # assert
+    assert response.status_code == 404
+    assert next(stream_mock.iter_content.return_value) == b'data'
+    stream_mock.close.assert_called_once()
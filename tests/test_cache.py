@@ -0,0 +1,67 @@
+from sts.cache import TtlCache
+
+
+class _FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_returns_value_before_ttl_expires():
+    # arrange
+    timer = _FakeTimer()
+    cache = TtlCache[str, int](maxsize=10, ttl=5, timer=timer)
+    cache.set('a', 1)
+
+    # act
+    timer.now = 4.9
+    result = cache.get('a')
+
+    # assert
+    assert result == 1
+
+
+def test_get_returns_default_after_ttl_expires():
+    # arrange
+    timer = _FakeTimer()
+    cache = TtlCache[str, int](maxsize=10, ttl=5, timer=timer)
+    cache.set('a', 1)
+
+    # act
+    timer.now = 5
+    result = cache.get('a', -1)
+
+    # assert
+    assert result == -1
+    assert len(cache) == 0
+
+
+def test_set_evicts_least_recently_used():
+    # arrange
+    cache = TtlCache[str, int](maxsize=2, ttl=5)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+
+    # act
+    cache.set('c', 3)
+
+    # assert
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+
+
+def test_pop_removes_key():
+    # arrange
+    cache = TtlCache[str, int](maxsize=2, ttl=5)
+    cache.set('a', 1)
+
+    # act
+    cache.pop('a')
+    cache.pop('missing')
+
+    # assert
+    assert cache.get('a') is None